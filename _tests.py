@@ -0,0 +1,237 @@
+"""
+Automated tests for the prompt file organizer, run with `prompt-get --test`.
+"""
+
+import os
+import tempfile
+from unittest import mock
+
+import prompt_get
+from prompt_get import consolidate_files, get_comment_header, should_skip_file
+
+
+def run_tests():
+    """
+    Run automated tests to verify functionality.
+    """
+    print("=== Running Automated Tests ===")
+    
+    # Test 1: Comment header generation
+    print("\nTest 1: Comment header generation")
+    test_comment_headers()
+    
+    # Test 2: File skip logic
+    print("\nTest 2: File skip logic")
+    test_file_skip_logic()
+    
+    # Test 3: Integration test
+    print("\nTest 3: Integration test")
+    test_integration()
+    
+    # Test 4: Unreadable directory
+    print("\nTest 4: Unreadable directory")
+    test_unreadable_directory()
+    
+    # Test 5: File removed during the walk
+    print("\nTest 5: File removed during the walk")
+    test_file_removed_during_walk()
+    
+    print("\n=== All Tests Complete ===")
+
+
+def test_comment_headers():
+    """Test comment header generation for different file types."""
+    test_cases = [
+        ('test.py', '# test.py\n'),
+        ('script.js', '// script.js\n'),
+        ('component.tsx', '// component.tsx\n'),
+        ('style.css', '<!-- style.css -->\n'),
+        ('index.html', '<!-- index.html -->\n'),
+        ('README.md', '# README.md\n'),
+    ]
+    
+    for file_path, expected in test_cases:
+        result = get_comment_header(file_path)
+        if result == expected:
+            print(f"  ✓ {file_path}: PASS")
+        else:
+            print(f"  ✗ {file_path}: FAIL (expected '{expected}', got '{result}')")
+
+
+def test_file_skip_logic():
+    """Test file skip logic."""
+    test_cases = [
+        ('.gitignore', True),  # Hidden file
+        ('.DS_Store', True),   # Hidden file
+        ('normal.py', False),  # Normal file
+        ('prompt.txt', True),  # Output file
+        ('package.json', True),  # Package file
+        ('package-lock.json', True),  # Package lock file
+        ('node_modules/package.json', True),  # File in node_modules
+        ('src/__pycache__/module.pyc', True),  # File in __pycache__
+        ('venv/bin/python', True),  # File in venv
+        ('src/components/App.jsx', False),  # Normal file in subdirectory
+        ('./src/app.py', False),  # Leading ./ is not a hidden component
+        ('../src/app.py', False),  # Leading ../ is not a hidden component
+        ('src/.github/ci.yml', True),  # File in hidden directory
+        ('src/venv', False),  # File named like a skipped directory
+    ]
+    
+    for file_path, expected in test_cases:
+        result = should_skip_file(file_path)
+        if result == expected:
+            print(f"  ✓ {file_path}: PASS")
+        else:
+            print(f"  ✗ {file_path}: FAIL (expected {expected}, got {result})")
+
+
+def test_integration():
+    """Test integration by creating a temporary directory with test files."""
+    # Create temporary directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print(f"  - Created temporary directory: {temp_dir}")
+        
+        # Create test files
+        test_files = {
+            'test.py': 'print("Hello World")',
+            'script.js': 'console.log("Hello World")',
+            'style.css': 'body { color: red; }',
+            'index.html': '<html><body>Hello</body></html>',
+            '.gitignore': '*.pyc',  # Should be skipped
+            'package.json': '{"name": "test"}',  # Should be skipped
+            'package-lock.json': '{"lockfileVersion": 1}',  # Should be skipped
+        }
+        
+        # Create directories that should be skipped
+        skip_dirs = ['node_modules', '__pycache__', 'venv', '.venv', '.tox']
+        for skip_dir in skip_dirs:
+            skip_dir_path = os.path.join(temp_dir, skip_dir)
+            os.makedirs(skip_dir_path, exist_ok=True)
+            # Add a file in each skip directory
+            skip_file_path = os.path.join(skip_dir_path, f'test_{skip_dir}.txt')
+            with open(skip_file_path, 'w') as f:
+                f.write(f'This file in {skip_dir} should be skipped')
+            print(f"  - Created skip directory: {skip_dir}")
+        
+        for filename, content in test_files.items():
+            file_path = os.path.join(temp_dir, filename)
+            with open(file_path, 'w') as f:
+                f.write(content)
+            print(f"  - Created test file: {filename}")
+        
+        # Create symlinks that should be skipped, including a loop back to the root
+        symlinks = {
+            'symlink_loop': temp_dir,
+            'symlink_file.py': os.path.join(temp_dir, 'test.py'),
+        }
+        for link_name, target in symlinks.items():
+            try:
+                os.symlink(target, os.path.join(temp_dir, link_name))
+                print(f"  - Created symlink: {link_name}")
+            except OSError as e:
+                print(f"  - Could not create symlink {link_name}: {e}")
+        
+        # Run consolidation
+        success = consolidate_files(temp_dir)
+        
+        if success:
+            # Check if prompt.txt was created
+            output_file = os.path.join(temp_dir, 'prompt.txt')
+            if os.path.exists(output_file):
+                with open(output_file, 'r') as f:
+                    content = f.read()
+                
+                # Verify content contains expected files
+                expected_files = ['test.py', 'script.js', 'style.css', 'index.html']
+                missing_files = [f for f in expected_files if f not in content]
+                
+                # Verify skip directories are not included
+                skip_files = [f'test_{skip_dir}.txt' for skip_dir in skip_dirs]
+                included_skip_files = [f for f in skip_files if f in content]
+                
+                # Verify package files are not included
+                package_files = ['package.json', 'package-lock.json']
+                included_package_files = [f for f in package_files if f in content]
+                
+                # Verify symlinks are not followed or included
+                included_symlinks = [f for f in symlinks if f in content]
+                
+                if not missing_files and '.gitignore' not in content and not included_skip_files and not included_package_files and not included_symlinks:
+                    print("  ✓ Integration test: PASS")
+                else:
+                    print(f"  ✗ Integration test: FAIL (missing: {missing_files}, included skip files: {included_skip_files}, included package files: {included_package_files}, included symlinks: {included_symlinks})")
+            else:
+                print("  ✗ Integration test: FAIL (prompt.txt not created)")
+        else:
+            print("  ✗ Integration test: FAIL (consolidation failed)")
+
+
+def test_unreadable_directory():
+    """Test that a directory that cannot be scanned is skipped, not fatal."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        locked_dir = os.path.join(temp_dir, 'locked')
+        os.makedirs(locked_dir)
+        test_files = {
+            'a.py': 'print("a")',
+            'b.py': 'print("b")',
+            os.path.join('locked', 'secret.py'): 'print("secret")',
+        }
+        for filename, content in test_files.items():
+            with open(os.path.join(temp_dir, filename), 'w') as f:
+                f.write(content)
+        
+        # Simulate a permission error for the locked directory only; chmod
+        # can't be relied on since the tests may run as root
+        real_scandir = os.scandir
+        
+        def scandir(path):
+            if path == locked_dir:
+                raise PermissionError(13, 'Permission denied', path)
+            return real_scandir(path)
+        
+        with mock.patch('os.scandir', scandir):
+            success = consolidate_files(temp_dir)
+        
+        output_file = os.path.join(temp_dir, 'prompt.txt')
+        content = ''
+        if os.path.exists(output_file):
+            with open(output_file, 'r') as f:
+                content = f.read()
+        
+        missing_files = [f for f in ['a.py', 'b.py'] if f not in content]
+        if success and not missing_files and 'secret.py' not in content:
+            print("  ✓ Unreadable directory: PASS")
+        else:
+            print(f"  ✗ Unreadable directory: FAIL (success: {success}, missing: {missing_files})")
+
+
+def test_file_removed_during_walk():
+    """Test that a file disappearing mid-walk gets a placeholder, not a failure."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for filename in ['a.py', 'b.py', 'c.py']:
+            with open(os.path.join(temp_dir, filename), 'w') as f:
+                f.write(f'print("{filename}")')
+        
+        # Remove b.py after the walker has listed it but before it is stat'ed
+        real_walk = prompt_get._walk
+        
+        def walk(*args):
+            for entry, relative_path in real_walk(*args):
+                if entry.name == 'b.py':
+                    os.remove(entry.path)
+                yield entry, relative_path
+        
+        with mock.patch('prompt_get._walk', walk):
+            success = consolidate_files(temp_dir)
+        
+        output_file = os.path.join(temp_dir, 'prompt.txt')
+        content = ''
+        if os.path.exists(output_file):
+            with open(output_file, 'r') as f:
+                content = f.read()
+        
+        missing_files = [f for f in ['a.py', 'c.py'] if f'print("{f}")' not in content]
+        if success and not missing_files and '[ERROR READING FILE' in content:
+            print("  ✓ File removed during walk: PASS")
+        else:
+            print(f"  ✗ File removed during walk: FAIL (success: {success}, missing: {missing_files})")
@@ -6,8 +6,134 @@ for use with Claude prompts that can read entire codebases at once.
 
 import os
 import sys
-from pathlib import Path
 import argparse
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+# Directories pruned during the walk; never descended into
+SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', 'venv'})
+
+# File names that are never included, wherever they appear
+SKIP_FILES = frozenset({'prompt.txt', 'package.json', 'package-lock.json'})
+
+# Files larger than this are left out of prompt.txt entirely
+MAX_BYTES = 10 * 1024 * 1024
+
+# Files with a NUL byte in this many leading bytes are treated as binary
+_SNIFF_BYTES = 8192
+
+# Files are read on a thread pool so several reads are in flight at once;
+# at most _MAX_PENDING_READS results are held in memory before being written
+_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_MAX_PENDING_READS = _READ_WORKERS * 4
+
+# Comment header templates keyed on lowercased file extension
+_HEADERS = {
+    'py': '# {}\n',
+    'js': '// {}\n',
+    'jsx': '// {}\n',
+    'ts': '// {}\n',
+    'tsx': '// {}\n',
+    'html': '<!-- {} -->\n',
+    'css': '<!-- {} -->\n',
+}
+_DEFAULT_HEADER = '# {}\n'
+
+# Per-file progress messages are only collected when --verbose is given, and
+# are written out in a single batch by flush_log()
+VERBOSE = False
+_log = []
+
+
+def log(message, *args):
+    """
+    Record a progress message if verbose output is enabled.
+    
+    The message is only %-formatted with args when it is recorded, so quiet
+    runs don't pay for building per-file messages.
+    
+    Args:
+        message (str): Message to record, optionally with %-style placeholders
+        *args: Values for the placeholders in message
+    """
+    if VERBOSE:
+        _log.append((message % args if args else message) + "\n")
+
+
+def flush_log():
+    """
+    Write all recorded progress messages to stdout in one call.
+    """
+    if _log:
+        sys.stdout.write(''.join(_log))
+        sys.stdout.flush()
+        _log.clear()
+
+
+def _is_excluded(name, is_dir):
+    """
+    Decide whether a single directory entry is left out of prompt.txt.
+    
+    This is the only place the skip rules live: hidden entries are always
+    excluded, directories named in SKIP_DIRS are pruned, and files named in
+    SKIP_FILES are dropped.
+    
+    Args:
+        name (str): Name of the file or directory
+        is_dir (bool): Whether the entry is a directory
+        
+    Returns:
+        bool: True if the entry should be skipped, False otherwise
+    """
+    if name.startswith('.'):
+        return True
+    return name in (SKIP_DIRS if is_dir else SKIP_FILES)
+
+
+def _walk(dir_path, rel_root=''):
+    """
+    Recursively yield file entries under a directory using os.scandir.
+    
+    Files in a directory are yielded before descending into its
+    subdirectories, matching the top-down order of os.walk. Entries rejected
+    by _is_excluded are dropped, and excluded directories are never
+    descended into, so nothing below them needs a per-file path check. Symlinks
+    are never followed or included, so link cycles cannot loop the walk.
+    Directories that cannot be listed are skipped rather than aborting.
+    
+    Args:
+        dir_path (str): Directory to scan
+        rel_root (str, optional): Path of dir_path relative to the
+            consolidation root, with a trailing separator unless empty
+        
+    Yields:
+        tuple: (os.DirEntry, str) entry and relative path for each file found
+    """
+    try:
+        it = os.scandir(dir_path)
+    except OSError as e:
+        # Like os.walk, skip directories that can't be listed
+        log("  - Error scanning directory %s: %s", dir_path, e)
+        return
+    
+    subdirs = []
+    with it:
+        for entry in it:
+            if entry.is_symlink():
+                log("  - Skipping symlink: %s", entry.path)
+                continue
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if _is_excluded(entry.name, is_dir):
+                log("  - Skipping excluded entry: %s", entry.path)
+                continue
+            if is_dir:
+                subdirs.append(entry)
+            else:
+                yield entry, rel_root + entry.name
+    for subdir in subdirs:
+        log("  - Scanning directory: %s", subdir.path)
+        yield from _walk(subdir.path, rel_root + subdir.name + os.sep)
 
 
 def get_comment_header(file_path):
@@ -20,88 +146,130 @@ def get_comment_header(file_path):
     Returns:
         str: Comment header for the file
     """
-    print(f"Determining comment header for: {file_path}")
-    
-    file_ext = Path(file_path).suffix.lower()
-    
-    if file_ext == '.py':
-        print(f"  - Python file detected (.py), using # comment style")
-        return f"# {file_path}\n"
-    elif file_ext in ['.js', '.jsx', '.ts', '.tsx']:
-        print(f"  - JavaScript/TypeScript file detected ({file_ext}), using // comment style")
-        return f"// {file_path}\n"
-    elif file_ext in ['.html', '.css']:
-        print(f"  - HTML/CSS file detected ({file_ext}), using <!-- --> comment style")
-        return f"<!-- {file_path} -->\n"
-    else:
-        print(f"  - Other file type detected ({file_ext}), using # comment style")
-        return f"# {file_path}\n"
+    _, dot, ext = file_path.rpartition('.')
+    header = _HEADERS.get(ext.lower(), _DEFAULT_HEADER) if dot else _DEFAULT_HEADER
+    return header.format(file_path)
 
 
 def should_skip_file(file_path):
     """
-    Determine if a file should be skipped (hidden files, directories, etc.).
+    Determine if a file should be skipped (hidden files, excluded directories, etc.).
+    
+    Not used by the walk itself, which applies _is_excluded to each entry as
+    it goes; this applies the same rule to every component of a relative
+    path, for checking paths outside a walk.
     
     Args:
-        file_path (str): Path to the file
+        file_path (str): Path to the file, relative to the consolidation root
         
     Returns:
         bool: True if file should be skipped, False otherwise
     """
-    path = Path(file_path)
-    
-    # Skip hidden files and directories
-    if path.name.startswith('.'):
-        print(f"  - Skipping hidden file/directory: {file_path}")
-        return True
-    
-    # Skip directories
-    if path.is_dir():
-        print(f"  - Skipping directory: {file_path}")
-        return True
-    
-    # Skip the output file itself
-    if path.name == 'prompt.txt':
-        print(f"  - Skipping output file: {file_path}")
-        return True
+    parts = [part for part in file_path.replace(os.sep, '/').split('/')
+             if part not in ('', '.', '..')]
+    if not parts:
+        return False
     
-    # Skip package.json and package-lock.json files
-    if path.name in ['package.json', 'package-lock.json']:
-        print(f"  - Skipping package file: {file_path}")
+    if any(_is_excluded(part, True) for part in parts[:-1]) or _is_excluded(parts[-1], False):
+        log("  - Skipping excluded file: %s", file_path)
         return True
-    
-    # Skip files in node_modules, __pycache__, and venv directories
-    path_parts = path.parts
-    for part in path_parts:
-        if part in ['node_modules', '__pycache__', 'venv']:
-            print(f"  - Skipping file in {part} directory: {file_path}")
-            return True
-    
     return False
 
 
 def read_file_content(file_path):
     """
-    Read the content of a file with error handling.
+    Read the raw bytes of a file with error handling.
+    
+    The bytes are copied through to prompt.txt unchanged. Files whose first
+    8 KiB contain a NUL byte are treated as binary without reading the rest;
+    anything else is decoded only to check that it is valid UTF-8, and
+    pure-ASCII files skip even that.
     
     Args:
         file_path (str): Path to the file
         
     Returns:
-        str: File content or error message
+        bytes: File content or error message
     """
     try:
-        print(f"  - Reading file content...")
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        print(f"  - Successfully read {len(content)} characters")
+        with open(file_path, 'rb') as f:
+            head = f.read(_SNIFF_BYTES)
+            if b'\x00' in head:
+                log("  - Error: %s contains non-text content, skipping", file_path)
+                return f"[BINARY FILE - {file_path}]\n".encode('utf-8')
+            content = head + f.read()
+        if not content.isascii():
+            content.decode('utf-8')
+        log("  - Successfully read %s bytes from %s", len(content), file_path)
         return content
     except UnicodeDecodeError:
-        print(f"  - Error: File contains non-text content, skipping")
-        return f"[BINARY FILE - {file_path}]\n"
+        log("  - Error: %s contains non-text content, skipping", file_path)
+        return f"[BINARY FILE - {file_path}]\n".encode('utf-8')
     except Exception as e:
-        print(f"  - Error reading file: {e}")
-        return f"[ERROR READING FILE - {file_path}: {e}]\n"
+        return _read_error(file_path, e)
+
+
+def _read_error(file_path, error):
+    """
+    Build the placeholder written in place of a file that could not be read.
+    
+    Args:
+        file_path (str): Path to the file
+        error (Exception): Error raised while reading it
+        
+    Returns:
+        bytes: Error message for prompt.txt
+    """
+    log("  - Error reading %s: %s", file_path, error)
+    return f"[ERROR READING FILE - {file_path}: {error}]\n".encode('utf-8')
+
+
+def process_entry(entry, rel_path, pool):
+    """
+    Size-check a single file found by the walker and schedule its read.
+    
+    Name-based filtering already happened in _walk, so only the size of the
+    file needs checking here. On POSIX this costs one stat call per file;
+    only is_dir() and is_symlink() come for free from the directory listing.
+    A file that cannot be stat'ed gets the read-error placeholder.
+    
+    Args:
+        entry (os.DirEntry): Scandir entry for the file
+        rel_path (str): Path of the file relative to the consolidation root
+        pool (ThreadPoolExecutor): Executor to submit the read to
+        
+    Returns:
+        Future: Pending result of read_file_content, or None if skipped
+    """
+    try:
+        size = entry.stat(follow_symlinks=False).st_size
+    except OSError as e:
+        # e.g. the file was removed after it was listed
+        future = Future()
+        future.set_result(_read_error(entry.path, e))
+        return future
+    
+    if size == 0:
+        log("  - Skipping empty file: %s", rel_path)
+        return None
+    if size > MAX_BYTES:
+        log("  - Skipping file larger than %s bytes: %s", MAX_BYTES, rel_path)
+        return None
+    
+    return pool.submit(read_file_content, entry.path)
+
+
+def write_section(out, rel_path, future):
+    """
+    Write a file's comment header and content to prompt.txt.
+    
+    Args:
+        out (file): Output file, opened in binary mode
+        rel_path (str): Path of the file relative to the consolidation root
+        future (Future): Pending result of read_file_content for the file
+    """
+    out.write(b''.join((get_comment_header(rel_path).encode('utf-8'), future.result(), b"\n\n")))
+    log("  - Added %s to consolidation", rel_path)
 
 
 def consolidate_files(current_dir):
@@ -117,58 +285,48 @@ def consolidate_files(current_dir):
     print(f"Starting file consolidation in directory: {current_dir}")
     
     output_file = os.path.join(current_dir, 'prompt.txt')
-    consolidated_content = []
+    # Hidden, so the walk never picks it up; only moved over prompt.txt once
+    # everything has been written, so a failed run leaves the old file intact
+    temp_file = os.path.join(current_dir, '.prompt.txt.tmp')
+    total_files = 0
     
-    # Walk through all files and subdirectories
+    # Walk through all files and subdirectories, reading them concurrently and
+    # streaming each one into the temporary file in walk order
     print("Scanning directory structure...")
-    for root, dirs, files in os.walk(current_dir):
-        # Skip .git directory entirely
-        if '.git' in dirs:
-            print(f"  - Skipping .git directory in: {root}")
-            dirs.remove('.git')
-        
-        # Skip node_modules, __pycache__, and venv directories entirely
-        for skip_dir in ['node_modules', '__pycache__', 'venv']:
-            if skip_dir in dirs:
-                print(f"  - Skipping {skip_dir} directory in: {root}")
-                dirs.remove(skip_dir)
-        
-        print(f"  - Scanning directory: {root}")
-        
-        for file in files:
-            file_path = os.path.join(root, file)
-            relative_path = os.path.relpath(file_path, current_dir)
-            
-            print(f"  - Processing file: {relative_path}")
-            
-            if should_skip_file(relative_path):
-                continue
-            
-            # Get appropriate comment header
-            comment_header = get_comment_header(relative_path)
-            
-            # Read file content
-            file_content = read_file_content(file_path)
-            
-            # Add to consolidated content
-            consolidated_content.append(comment_header)
-            consolidated_content.append(file_content)
-            consolidated_content.append("\n\n")
-            
-            print(f"  - Added file to consolidation")
-    
-    # Write consolidated content to prompt.txt
     print(f"Writing consolidated content to: {output_file}")
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.writelines(consolidated_content)
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool, \
+                open(temp_file, 'wb', buffering=1 << 20) as out:
+            pending = deque()
+            log("  - Scanning directory: %s", current_dir)
+            for entry, relative_path in _walk(current_dir):
+                log("  - Processing file: %s", relative_path)
+                
+                future = process_entry(entry, relative_path, pool)
+                if future is None:
+                    continue
+                pending.append((relative_path, future))
+                
+                if len(pending) >= _MAX_PENDING_READS:
+                    write_section(out, *pending.popleft())
+                    total_files += 1
+            
+            while pending:
+                write_section(out, *pending.popleft())
+                total_files += 1
         
-        total_files = len([item for item in consolidated_content if item.startswith('#') or item.startswith('//') or item.startswith('<!--')])
+        os.replace(temp_file, output_file)
+        flush_log()
         print(f"Successfully created {output_file} with {total_files} files consolidated")
         return True
         
     except Exception as e:
-        print(f"Error writing output file: {e}")
+        flush_log()
+        print(f"Error consolidating files: {e}")
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
         return False
 
 
@@ -178,11 +336,21 @@ def main():
     """
     parser = argparse.ArgumentParser(description='Consolidate all files in current directory into prompt.txt')
     parser.add_argument('--test', action='store_true', help='Run automated tests')
+    parser.add_argument('--verbose', action='store_true', help='Show per-file progress messages')
     args = parser.parse_args()
     
+    global VERBOSE
+    VERBOSE = args.verbose
+    
     if args.test:
         print("Running automated tests...")
-        run_tests()
+        # The tests live in _tests.py so normal runs don't pay to load them;
+        # register this module under its import name so they share its state
+        # even when it is run as a script
+        sys.modules.setdefault('prompt_get', sys.modules[__name__])
+        import _tests
+        _tests.run_tests()
+        flush_log()
         return
     
     print("=== Prompt File Organizer ===")
@@ -204,137 +372,5 @@ def main():
         sys.exit(1)
 
 
-def run_tests():
-    """
-    Run automated tests to verify functionality.
-    """
-    print("=== Running Automated Tests ===")
-    
-    # Test 1: Comment header generation
-    print("\nTest 1: Comment header generation")
-    test_comment_headers()
-    
-    # Test 2: File skip logic
-    print("\nTest 2: File skip logic")
-    test_file_skip_logic()
-    
-    # Test 3: Integration test
-    print("\nTest 3: Integration test")
-    test_integration()
-    
-    print("\n=== All Tests Complete ===")
-
-
-def test_comment_headers():
-    """Test comment header generation for different file types."""
-    test_cases = [
-        ('test.py', '# test.py\n'),
-        ('script.js', '// script.js\n'),
-        ('component.tsx', '// component.tsx\n'),
-        ('style.css', '<!-- style.css -->\n'),
-        ('index.html', '<!-- index.html -->\n'),
-        ('README.md', '# README.md\n'),
-    ]
-    
-    for file_path, expected in test_cases:
-        result = get_comment_header(file_path)
-        if result == expected:
-            print(f"  ✓ {file_path}: PASS")
-        else:
-            print(f"  ✗ {file_path}: FAIL (expected '{expected}', got '{result}')")
-
-
-def test_file_skip_logic():
-    """Test file skip logic."""
-    test_cases = [
-        ('.gitignore', True),  # Hidden file
-        ('.DS_Store', True),   # Hidden file
-        ('normal.py', False),  # Normal file
-        ('prompt.txt', True),  # Output file
-        ('package.json', True),  # Package file
-        ('package-lock.json', True),  # Package lock file
-        ('node_modules/package.json', True),  # File in node_modules
-        ('src/__pycache__/module.pyc', True),  # File in __pycache__
-        ('venv/bin/python', True),  # File in venv
-        ('src/components/App.jsx', False),  # Normal file in subdirectory
-    ]
-    
-    for file_path, expected in test_cases:
-        result = should_skip_file(file_path)
-        if result == expected:
-            print(f"  ✓ {file_path}: PASS")
-        else:
-            print(f"  ✗ {file_path}: FAIL (expected {expected}, got {result})")
-
-
-def test_integration():
-    """Test integration by creating a temporary directory with test files."""
-    import tempfile
-    import shutil
-    
-    # Create temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        print(f"  - Created temporary directory: {temp_dir}")
-        
-        # Create test files
-        test_files = {
-            'test.py': 'print("Hello World")',
-            'script.js': 'console.log("Hello World")',
-            'style.css': 'body { color: red; }',
-            'index.html': '<html><body>Hello</body></html>',
-            '.gitignore': '*.pyc',  # Should be skipped
-            'package.json': '{"name": "test"}',  # Should be skipped
-            'package-lock.json': '{"lockfileVersion": 1}',  # Should be skipped
-        }
-        
-        # Create directories that should be skipped
-        skip_dirs = ['node_modules', '__pycache__', 'venv']
-        for skip_dir in skip_dirs:
-            skip_dir_path = os.path.join(temp_dir, skip_dir)
-            os.makedirs(skip_dir_path, exist_ok=True)
-            # Add a file in each skip directory
-            skip_file_path = os.path.join(skip_dir_path, f'test_{skip_dir}.txt')
-            with open(skip_file_path, 'w') as f:
-                f.write(f'This file in {skip_dir} should be skipped')
-            print(f"  - Created skip directory: {skip_dir}")
-        
-        for filename, content in test_files.items():
-            file_path = os.path.join(temp_dir, filename)
-            with open(file_path, 'w') as f:
-                f.write(content)
-            print(f"  - Created test file: {filename}")
-        
-        # Run consolidation
-        success = consolidate_files(temp_dir)
-        
-        if success:
-            # Check if prompt.txt was created
-            output_file = os.path.join(temp_dir, 'prompt.txt')
-            if os.path.exists(output_file):
-                with open(output_file, 'r') as f:
-                    content = f.read()
-                
-                # Verify content contains expected files
-                expected_files = ['test.py', 'script.js', 'style.css', 'index.html']
-                missing_files = [f for f in expected_files if f not in content]
-                
-                # Verify skip directories are not included
-                skip_files = ['test_node_modules.txt', 'test___pycache__.txt', 'test_venv.txt']
-                included_skip_files = [f for f in skip_files if f in content]
-                
-                # Verify package files are not included
-                package_files = ['package.json', 'package-lock.json']
-                included_package_files = [f for f in package_files if f in content]
-                
-                if not missing_files and '.gitignore' not in content and not included_skip_files and not included_package_files:
-                    print("  ✓ Integration test: PASS")
-                else:
-                    print(f"  ✗ Integration test: FAIL (missing: {missing_files}, included skip files: {included_skip_files}, included package files: {included_package_files})")
-            else:
-                print("  ✗ Integration test: FAIL (prompt.txt not created)")
-        else:
-            print("  ✗ Integration test: FAIL (consolidation failed)")
-
-
 if __name__ == "__main__":
     main() 
\ No newline at end of file